@@ -1,5 +1,7 @@
 import asyncio
-import json
+import functools
+import orjson
+import time
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
@@ -8,15 +10,16 @@ class FirmwareType(Enum):
     MESHTASTIC = "meshtastic"
     MESHCORE = "meshcore"
 
+import logging
+
 import utils.logger
 
 from fastapi import FastAPI, Request
 from contextlib import asynccontextmanager
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 import uvicorn
 
-from threading import Thread
 from fastapi import APIRouter
 from fastapi import Request
 from fastapi.responses import FileResponse, StreamingResponse
@@ -24,7 +27,6 @@ from fastapi.templating import Jinja2Templates
 
 import aiofiles
 import yaml
-from jsonmerge import merge
 
 # News module
 from apps.news.routes import router as news_router
@@ -50,61 +52,76 @@ from utils.partition_parser import (
     )
 
 # Shared version comparison utility
-from utils.version import CustomLooseVersion
+from utils.version import CustomLooseVersion, version_key
+
+# Bounded TTL cache for the read-only builder endpoints
+from utils.cache import async_ttl_cache
+
+# Pure (mypyc-compilable) reducers for the firmware tree walk
+from utils.fw_reduce import (
+        classify_device_by_files,
+        classify_device_by_info,
+        classify_version_files,
+    )
 
 
 # Copied from device-install.sh
-BIGDB_8MB=(
-	"picomputer-s3"
-	"unphone"
-	"seeed-sensecap-indicator"
-	"crowpanel-esp32s3"
-	"heltec_capsule_sensor_v3"
-	"heltec-v3"
-	"heltec-vision-master-e213"
-	"heltec-vision-master-e290"
-	"heltec-vision-master-t190"
-	"heltec-wireless-paper"
-	"heltec-wireless-tracker"
-	"heltec-wsl-v3"
-	"icarus"
-	"seeed-xiao-s3"
-	"tbeam-s3-core"
-	"tracksenger"
-)
-BIGDB_16MB=(
-	"t-deck"
-	"mesh-tab"
-	"t-energy-s3"
-	"dreamcatcher"
-	"ESP32-S3-Pico"
-	"m5stack-cores3"
-	"station-g2"
-    "t-eth-elite"
-    "t-watch-s3"
-    "elecrow-adv-35-tft"
-    "elecrow-adv-24-28-tft"
-    "elecrow-adv1-43-50-70-tft"
-)
-S3_VARIANTS=(
-    "s3"
-    "-v3"
-    "t-deck"
-    "wireless-paper"
-    "wireless-tracker"
-    "station-g2"
-    "unphone"
-    "t-eth-elite"
-    "mesh-tab"
-    "dreamcatcher"
-    "ESP32-S3-Pico"
-    "seeed-sensecap-indicator"
-    "heltec_capsule_sensor_v3"
-    "vision-master"
-    "icarus"
-    "tracksenger"
-    "elecrow-adv"
+# NOTE: the entries used to be newline-concatenated into one string, which
+# made "t in BIGDB_8MB" a substring test; real frozensets give exact O(1)
+# membership, matching device-install.sh behaviour
+BIGDB_8MB = frozenset((
+    "picomputer-s3",
+    "unphone",
+    "seeed-sensecap-indicator",
+    "crowpanel-esp32s3",
+    "heltec_capsule_sensor_v3",
+    "heltec-v3",
+    "heltec-vision-master-e213",
+    "heltec-vision-master-e290",
+    "heltec-vision-master-t190",
+    "heltec-wireless-paper",
+    "heltec-wireless-tracker",
+    "heltec-wsl-v3",
+    "icarus",
+    "seeed-xiao-s3",
+    "tbeam-s3-core",
+    "tracksenger",
+))
+BIGDB_16MB = frozenset((
+    "t-deck",
+    "mesh-tab",
+    "t-energy-s3",
+    "dreamcatcher",
+    "ESP32-S3-Pico",
+    "m5stack-cores3",
+    "station-g2",
+    "t-eth-elite",
+    "t-watch-s3",
+    "elecrow-adv-35-tft",
+    "elecrow-adv-24-28-tft",
+    "elecrow-adv1-43-50-70-tft",
+))
+S3_VARIANTS = (
+    "s3",
+    "-v3",
+    "t-deck",
+    "wireless-paper",
+    "wireless-tracker",
+    "station-g2",
+    "unphone",
+    "t-eth-elite",
+    "mesh-tab",
+    "dreamcatcher",
+    "ESP32-S3-Pico",
+    "seeed-sensecap-indicator",
+    "heltec_capsule_sensor_v3",
+    "vision-master",
+    "icarus",
+    "tracksenger",
+    "elecrow-adv",
 )
+# One pass over t instead of a chain of substring probes
+_S3_VARIANT_RE = re.compile('|'.join(map(re.escape, S3_VARIANTS)))
 
 #period_pattern = re.compile("^\d{4}-\d{1,2}$")
 fwfiles = None
@@ -113,11 +130,26 @@ log = utils.logger.getLogger()
 DEBUG2 =5
 
 config = {}
+# Derived read-only views of config['fwDirs'], rebuilt by loadConfig so hot
+# paths don't re-derive them on every call
+FW_PATHS = ()
+FW_SRCS = ()
+
+def _deep_merge(base, diff):
+    # Recursive dict merge: nested dicts are merged, everything else
+    # in diff overwrites base (same result as jsonmerge's default
+    # strategy for our two-level config, without the schema machinery)
+    result = dict(base)
+    for key, value in diff.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = _deep_merge(result[key], value)
+        else:
+            result[key] = value
+    return result
 
-aiofiles.os.walk = aiofiles.os.wrap(os.walk)
 
 def loadConfig():
-    global config
+    global config, FW_PATHS, FW_SRCS
     with open('config/config.yml', 'r') as f:
         cfg_data = yaml.safe_load(f)
 
@@ -125,7 +157,7 @@ def loadConfig():
         diff = cfg_data['enviroments'][cfg_data['enviroment']]
         base = base if base else {}
         diff = diff if diff else {}
-        config = merge(base, diff)
+        config = _deep_merge(base, diff)
 
     # Validate firmware type for all repositories
     if 'fwDirs' in config:
@@ -142,18 +174,228 @@ def loadConfig():
             else:
                 # Legacy string entries or entries without type
                 validated_dirs.append(fw_dir)
-        config['fwDirs'] = validated_dirs
+        # Tuple keeps the hot loops iterating over an immutable snapshot
+        config['fwDirs'] = tuple(validated_dirs)
+
+    FW_PATHS = tuple(rf if isinstance(rf, str) else rf.get('path', None) for rf in config.get('fwDirs', ()))
+    FW_SRCS = tuple({'src': rf.get('src', None), 'desc': rf.get('desc', ''), 'type': rf.get('type', FirmwareType.MESHTASTIC.value)}
+                    for rf in config.get('fwDirs', ()) if isinstance(rf, dict) and rf.get('src', None))
+
+    # Resolved root folders depend on fwDirs - drop them on reload
+    getRootFolder.cache_clear()
+    _known_dirs.clear()
+    _fw_scan_cache.clear()
+    # Cached geo lookups depend on the configured ipInfo endpoint
+    _fetch_ip_info.cache_clear()
+
+
+# Meshtastic version format: v2.4.3.efc27f2
+_MESHTASTIC_VER_RE = re.compile(r"^(?P<mver>([\w\d]+\.){2}([\w\d]+))\.(?P<n>[\w\d]+)\.*(?P<daily>daily)*$")
+
+
+def _parse_meshtastic_version(version):
+    # Split-based fast path for the common version layouts; the regex
+    # stays as a fallback for anything less regular. Returns
+    # (mver, daily) or None when the string is not a version at all.
+    parts = version.split('.')
+    if len(parts) == 4 and all(p.isalnum() for p in parts):
+        return '.'.join(parts[:3]), None
+    if len(parts) == 5 and parts[4] == 'daily' and all(p.isalnum() for p in parts[:4]):
+        return '.'.join(parts[:3]), 'daily'
+    matches = _MESHTASTIC_VER_RE.search(version)
+    if matches:
+        return matches.group('mver'), matches.group('daily')
+    return None
 
+# Conservative filename/parameter whitelist (no path separators)
+_SAFE_NAME_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
 
-hidden_regex = re.compile(r"^_.*")
+# Memoized compile for patterns parameterized at call time (file masks etc.)
+_compile_cached = functools.lru_cache(maxsize=128)(re.compile)
 
 
-async def getAvailableFirmwares(src = None, rootFolder = None, t:str = None):
-    data = {"espdevices":[], "uf2devices":[], "rp2040devices":[], "versions":[], "device_names":[]}
+def _is_hidden(name):
+    # Hidden devices/versions are marked with a leading underscore
+    return name.startswith('_')
+
+
+def _is_device_level(address, rootFolder):
+    # True when address is exactly one path segment below rootFolder
+    # (same semantics as the old "^" + rootFolder + "[^/]+$" regex)
+    if not address.startswith(rootFolder):
+        return False
+    rest = address[len(rootFolder):]
+    return bool(rest) and '/' not in rest
+
+# Known (rootFolder, device[, version]) locations, filled during the
+# getAvailableFirmwares walk so getRootFolder can skip isdir() probes
+_known_dirs = set()
+
+
+def _read_file(path):
+    # Plain blocking read, meant to be called via asyncio.to_thread.
+    # Small info files (<1 KB) need one thread hop, not one per open/read/close.
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _walk_sync(path, max_depth=None, skip_hidden=False):
+    """
+    os.walk materialized into a list, with optional depth limit and
+    hidden-dir pruning. max_depth=0 returns only the root entry (its dirs
+    still listed), max_depth=1 adds the first level below it, and so on.
+    """
+    base_depth = os.path.normpath(path).count(os.sep)
+    result = []
+    for address, dirs, files in os.walk(path, topdown=True, onerror=None, followlinks=False):
+        if skip_hidden:
+            if address == path:
+                for d in dirs:
+                    if _is_hidden(d):
+                        log.info(f"Skipping device {d} - marked as hidden")
+            dirs[:] = [d for d in dirs if not _is_hidden(d)]
+        result.append((address, list(dirs), files))
+        if max_depth is not None and os.path.normpath(address).count(os.sep) - base_depth >= max_depth:
+            # Prune descent below the requested depth
+            dirs[:] = []
+    return result
+
+
+def _probe_version_files(path):
+    # One executor hop per version dir, returning just the two booleans the
+    # classifier needs instead of the full DirEntry list
+    with os.scandir(path) as entries:
+        return classify_version_files([e.name for e in entries])
+
+
+# Parsed info files: path -> (mtime_ns, parsed dict). Entries are
+# revalidated by mtime on every hit, so the dict stays correct without TTL
+_json_cache = {}
+
+
+def _load_json_sync(path):
+    mtime = os.stat(path).st_mtime_ns
+    hit = _json_cache.get(path)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    with open(path, 'rb') as f:
+        content = f.read()
+    parsed = orjson.loads(content) if content else None
+    _json_cache[path] = (mtime, parsed)
+    return parsed
+
+
+async def _load_json_cached(path):
+    # Stat, (re)read and parse in one executor hop; warm hits cost a stat
+    return await asyncio.to_thread(_load_json_sync, path)
+
+
+def _scandir_split(path):
+    # Single scandir pass returning (dir_names, file_names); unreadable
+    # paths yield empty listings, same as os.walk with onerror=None
+    dirs = []
+    files = []
+    try:
+        with os.scandir(path) as entries:
+            for e in entries:
+                (dirs if e.is_dir() else files).append(e.name)
+    except OSError:
+        pass
+    return dirs, files
+
+
+async def _walk(path, max_depth=None, skip_hidden=False):
+    # aiofiles' wrap(os.walk) only creates the generator inside the
+    # executor; iterating it still runs every readdir on the event loop
+    # thread. Materialize the whole (depth-limited) walk in one hop instead.
+    return await asyncio.to_thread(_walk_sync, path, max_depth, skip_hidden)
+
+
+# Per-root scan results: rootFolder -> {'mtime': int|None, 'checked': float, 'scan': dict}
+_fw_scan_cache = {}
+# Rescan period; also bounds staleness for changes that do not touch the
+# root mtime (e.g. a new version dir below an existing device)
+_FW_SCAN_TTL = 30
+
+
+async def _scan_root(rootFolder):
+    """
+    Walk one firmware root and classify its devices.
+
+    The walk result is cached per root: while the entry is fresh a single
+    stat() of the root confirms its mtime, and the tree is re-walked after
+    _FW_SCAN_TTL seconds regardless.
+    """
+    now = time.monotonic()
+    cached = _fw_scan_cache.get(rootFolder)
+    try:
+        mtime = (await asyncio.to_thread(os.stat, rootFolder)).st_mtime_ns
+    except OSError:
+        mtime = None
+    if cached and now - cached['checked'] < _FW_SCAN_TTL and mtime is not None and mtime == cached['mtime']:
+        return cached['scan']
+
+    espdevices = set()
+    uf2devices = set()
+    rp2040devices = set()
+    device_names = {}
+    versions_by_device = {}
+
+    # Drop this root's remembered locations before re-adding the fresh
+    # ones, so deleted/archived version dirs don't linger until restart
+    _known_dirs.difference_update([k for k in _known_dirs if k[0] == rootFolder])
+
+    # Two explicit levels - devices, then their versions - instead of a
+    # pruned os.walk: nothing below the version dirs is ever listed
+    devices = []
+    for d in (await asyncio.to_thread(_scandir_split, rootFolder))[0]:
+        if _is_hidden(d):
+            log.info(f"Skipping device {d} - marked as hidden")
+        else:
+            devices.append(d)
+
+    # List all device dirs concurrently
+    listings = await asyncio.gather(
+        *[asyncio.to_thread(_scandir_split, os.path.join(rootFolder, device)) for device in devices])
+
+    for device, (dirs, files) in zip(devices, listings):
+        address = os.path.join(rootFolder, device)
+        dirs = [d for d in dirs if not _is_hidden(d)]
+
+        # Find device.info file and read it as json if exists
+        jdev = None
+        if "device.info" in files:
+            # 'in files' already proved existence, no isfile() probe needed
+            jdev = await _load_json_cached(os.path.join(address, "device.info"))
+            if jdev:
+                classify_device_by_info(device, jdev, espdevices, uf2devices, rp2040devices, device_names)
+
+        # Remember where this device and its versions live for getRootFolder
+        _known_dirs.add((rootFolder, device))
+        for d in dirs:
+            _known_dirs.add((rootFolder, device, d))
+
+        versions_by_device[address] = dirs
+        if not jdev:
+            # Probe all version dirs concurrently instead of one serial scandir hop each
+            probes = await asyncio.gather(
+                *[asyncio.to_thread(_probe_version_files, os.path.join(address, d)) for d in dirs])
+            for uf2find, otafind in probes:
+                classify_device_by_files(device, uf2find, otafind, espdevices, uf2devices, rp2040devices)
+
+    scan = {
+        "espdevices": espdevices,
+        "uf2devices": uf2devices,
+        "rp2040devices": rp2040devices,
+        "device_names": device_names,
+        "versions_by_device": versions_by_device,
+    }
+    _fw_scan_cache[rootFolder] = {'mtime': mtime, 'checked': now, 'scan': scan}
+    return scan
 
-    uf2files_pattern = re.compile(r".*\.uf2")
-    otafiles_pattern = re.compile(r".*\.zip")
 
+async def getAvailableFirmwares(src = None, rootFolder = None, t:str = None):
+    data = {"espdevices":[], "uf2devices":[], "rp2040devices":[], "versions":[], "device_names":[]}
 
     # Builds output folders with pattern 'device'/'version'
     #rootFolder = None
@@ -166,8 +408,8 @@ async def getAvailableFirmwares(src = None, rootFolder = None, t:str = None):
 
     rootFolder, src, fw_type = await getRootFolder(src=src)
 
-    paths = [rf if isinstance(rf, str) else rf.get('path', None) for rf in config['fwDirs']]
-    srcs = [{'src': rf.get('src', None), 'desc': rf.get('desc', ''), 'type': rf.get('type', FirmwareType.MESHTASTIC.value)} for rf in config['fwDirs'] if isinstance(rf,dict) and rf.get('src', None)]
+    paths = FW_PATHS
+    srcs = list(FW_SRCS)
     src_values = [s['src'] for s in srcs]
     if not rootFolder and src in src_values:
         for rf in config['fwDirs']:
@@ -179,58 +421,14 @@ async def getAvailableFirmwares(src = None, rootFolder = None, t:str = None):
     if not rootFolder and paths:
         rootFolder = paths[0]
     if rootFolder:
-        address_pattern = re.compile("^"+rootFolder+"[^/]+$")
-        for address, dirs, files in await aiofiles.os.walk(rootFolder, topdown=True, onerror=None, followlinks=False):
-            if address == rootFolder:
-                pass
-            if bool(address_pattern.match(address)):
-                if bool(hidden_regex.match(Path(address).name)):
-                    log.info(f"Skipping device {Path(address).name} - marked as hidden")
-                    continue
-
-                # Find device.info file and read it as json if exists
-                content = None
-                jdev = None
-                for file in files:
-                    if "device.info" == file:
-                        if(await aiofiles.os.path.isfile(os.path.join(address,file))):
-                            async with aiofiles.open(os.path.join(address,file),'r') as f:
-                                content = await f.read()
-                            if content:
-                                jdev = json.loads(content)
-                                if(jdev.get('name')):
-                                    if(jdev.get('type')=='esp32'):
-                                        espdevices.add(Path(address).name)
-                                    if(jdev.get('type')=='nrf52'):
-                                        uf2devices.add(Path(address).name)
-                                    if(jdev.get('type')=='rp2040'):
-                                        rp2040devices.add(Path(address).name)
-                                    device_names[Path(address).name] = jdev.get('name')
-                            break
-
-                # Remove hidden versions
-                if (t and address.endswith(t)) or (not t):
-                    versions = versions.union(set([d for d in dirs if not bool(hidden_regex.match(d))]))
-                if not jdev:
-                    for d in dirs:
-                        files = await aiofiles.os.scandir(os.path.join(address,d))
-                        uf2find = False
-                        otafind = False
-                        for f in files:
-                            if uf2files_pattern.match(f.name):
-                                #uf2devices.add(Path(address).name)
-                                uf2find = True
-                                #break
-                            if otafiles_pattern.match(f.name):
-                                #uf2devices.add(Path(address).name)
-                                otafind = True
-                                #break
-                        if not uf2find:
-                            espdevices.add(Path(address).name)
-                        if uf2find and otafind: #nrf devices
-                            uf2devices.add(Path(address).name)
-                        if uf2find and not otafind: #rp2040 devices
-                            rp2040devices.add(Path(address).name)
+        scan = await _scan_root(rootFolder)
+        espdevices = scan["espdevices"]
+        uf2devices = scan["uf2devices"]
+        rp2040devices = scan["rp2040devices"]
+        device_names = scan["device_names"]
+        for address, vers in scan["versions_by_device"].items():
+            if (t and address.endswith(t)) or (not t):
+                versions.update(vers)
 
 
     data["espdevices"] = list(set(data["espdevices"]).union(espdevices))
@@ -245,11 +443,12 @@ async def getAvailableFirmwares(src = None, rootFolder = None, t:str = None):
     data["srcs"] = srcs
 
 
-    data["versions"].sort(reverse=True, key=CustomLooseVersion)
+    data["versions"].sort(reverse=True, key=version_key)
 
 
     return data
 
+@async_ttl_cache(ttl=30, maxsize=256)
 async def buildInfoblock(t:str = None, v:str = None, src:str = None):
     infoblock={'info':"",'error':None}
     rmfile = "readme.md"
@@ -259,14 +458,14 @@ async def buildInfoblock(t:str = None, v:str = None, src:str = None):
         rmfile = os.path.join(rootFolder,t,rmfile)
 
     try:
-        async with aiofiles.open(rmfile,'r') as file:
-            content = await file.read()
-        infoblock['info'] = content
+        content = await asyncio.to_thread(_read_file, rmfile)
+        infoblock['info'] = content.decode('utf-8')
     except Exception as e:
         log.info("readme.md file not found")
         infoblock['error'] = "readme_not_found"
     return infoblock
 
+@async_ttl_cache(ttl=30, maxsize=256)
 async def buildVersions(t:str = None, src:str = None):
     data = {"versions":[]}
     versions_map = {}
@@ -277,26 +476,15 @@ async def buildVersions(t:str = None, src:str = None):
     rootFolder, src, fw_type = await getRootFolder(t=t, src=src)
 
     if rootFolder:
-        address_pattern = re.compile("^"+rootFolder+"[^/]+$")
-
-        # Choose regex based on firmware type
-        if fw_type == FirmwareType.MESHCORE:
-            # Meshcore: v1.11.0.6d32193.companion.ble format
-            reg = r"^v(?P<mver>([\w\d]+\.){2}([\w\d]+))\.(?P<n>[\w\d-]+)\.(?P<variant>[^\.]+)(\.(?P<extra>.+))?$"
-        else:
-            # Meshtastic: v2.4.3.efc27f2 format
-            reg = r"^(?P<mver>([\w\d]+\.){2}([\w\d]+))\.(?P<n>[\w\d]+)\.*(?P<daily>daily)*$"
-
         path = os.path.join(rootFolder,t)
         if os.path.commonprefix((os.path.realpath(path),os.path.realpath(rootFolder))) != os.path.realpath(rootFolder):
             pass # Something incorrect with path, maybe traversal attack
         else:
-            for address, dirs, files in await aiofiles.os.walk(path, topdown=True, onerror=None, followlinks=False):
-                if address == rootFolder:
-                    dataDirs = dirs
-                if bool(address_pattern.match(address)):
-                    for d in dirs:
-                        if bool(hidden_regex.match(d)):
+            # Single scandir of the device dir - versions are its subdirs
+            if _is_device_level(path, rootFolder):
+                address = path
+                for d in (await asyncio.to_thread(_scandir_split, path))[0]:
+                        if _is_hidden(d):
                             log.info(f"Skipping version '{d}' - marked as hidden")
                             continue
                         files = await aiofiles.os.scandir(os.path.join(address,d))
@@ -307,50 +495,44 @@ async def buildVersions(t:str = None, src:str = None):
                                 info_find = True
                                 break
                         if info_find:
-                            content = None
-                            async with aiofiles.open(file.path,'r') as f:
-                                content = await f.read()
-                            if content:
-                                jver = json.loads(content)
-
-                                matches= re.search(reg, jver.get('version'))
-
+                            jver = await _load_json_cached(file.path)
+                            if jver:
                                 # Assume that `latestTag`` exist only for daily versions
                                 if jver.get('latestTag',None):
                                     latestTags[jver.get('version')] = jver.get('latestTag',None)
 
-                                if matches:
-                                    if fw_type == FirmwareType.MESHCORE:
-                                        # Meshcore: use full version for uniqueness (includes variant)
-                                        sver = f"{jver.get('version')} {jver.get('date')} "
-                                    else:
-                                        # Meshtastic: use mver + date + daily format
-                                        sver = f"{matches.group('mver')} {jver.get('date')} {matches.group('daily')}"
-                                else:
-                                    # Fallback for versions without regex match
+                                if fw_type == FirmwareType.MESHCORE:
+                                    # Meshcore: use full version for uniqueness (includes variant)
                                     sver = f"{jver.get('version')} {jver.get('date')} "
+                                else:
+                                    parsed = _parse_meshtastic_version(jver.get('version'))
+                                    if parsed:
+                                        # Meshtastic: use mver + date + daily format
+                                        sver = f"{parsed[0]} {jver.get('date')} {parsed[1]}"
+                                    else:
+                                        # Fallback for versions without a parseable format
+                                        sver = f"{jver.get('version')} {jver.get('date')} "
                                 versions_map[sver] = jver.get('version')
                                 dates_map[jver.get('version')] = jver.get('date')
                                 notes_map[jver.get('version')] = jver.get('notes')
                                 #data.get('versions',[]).append(sver)
                         else:
-                                    #reg = r"^(?P<mver>([\w\d]+\.){2}([\w\d]+))\.(?P<n>[\w\d]+)\.*(?P<daily>daily)*$"
-                            matches= re.search(reg, d)
-                            if matches:
-                                if fw_type == FirmwareType.MESHCORE:
-                                    # Meshcore: use full version
-                                    sver = f"{d} 00:00:00 "
-                                else:
-                                    # Meshtastic: use mver format
-                                    sver = f"{matches.group('mver')} 00:00:00 {matches.group('daily')}"
-                            else:
-                                # Fallback for versions without regex match
+                            if fw_type == FirmwareType.MESHCORE:
+                                # Meshcore: use full version
                                 sver = f"{d} 00:00:00 "
+                            else:
+                                parsed = _parse_meshtastic_version(d)
+                                if parsed:
+                                    # Meshtastic: use mver format
+                                    sver = f"{parsed[0]} 00:00:00 {parsed[1]}"
+                                else:
+                                    # Fallback for versions without a parseable format
+                                    sver = f"{d} 00:00:00 "
                             versions_map[sver] = d
                                     #data.get('versions',[]).append(sver)
 
     versorted = list(versions_map.keys())
-    versorted.sort(reverse=True, key=CustomLooseVersion)
+    versorted.sort(reverse=True, key=version_key)
     data["versions"] = [versions_map.get(v) for v in versorted] + data["versions"]
     # Remove possible dublicates
     data["versions"] = list(dict.fromkeys(data["versions"]))
@@ -371,7 +553,7 @@ async def loadInfo(t = None, v = None, rootFolder = None):
         if not (await aiofiles.os.path.isdir(os.path.join(rootFolder,t,v))):
                 rootFolder = None
     if not rootFolder:
-        for rf in config['fwDirs']:
+        for rf in FW_PATHS:
             if(await aiofiles.os.path.isdir(os.path.join(rf,t,v))):
                 rootFolder = rf
                 break
@@ -383,31 +565,71 @@ async def loadInfo(t = None, v = None, rootFolder = None):
 
     if(not await aiofiles.os.path.isfile(ipath)):
             return {}
-    content = None
-    async with aiofiles.open(ipath,'r') as f:
-            content = await f.read()
-    if content:
-        jver = json.loads(content)
+    jver = await _load_json_cached(ipath) or {}
 
     return jver
 
-async def generate_zip(folder_path, json_data:str = None):
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        # Добавляем файл с JSON данными
-        if json_data:
-            json_str = json.dumps(json_data, ensure_ascii=False, indent=2)
-            zipf.writestr("manifest.json", json_str)
+class _QueueWriter(io.RawIOBase):
+    """Bridges blocking ZipFile writes on a worker thread to an asyncio.Queue."""
 
-        # Добавляем файлы из папки
-        for root, dirs, files in await aiofiles.os.walk(folder_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                arcname = os.path.relpath(file_path, folder_path)
-                zipf.write(file_path, arcname)
+    def __init__(self, queue, loop):
+        self._queue = queue
+        self._loop = loop
 
-    zip_buffer.seek(0)
-    return zip_buffer
+    def writable(self):
+        return True
+
+    def write(self, b):
+        asyncio.run_coroutine_threadsafe(self._queue.put(bytes(b)), self._loop).result()
+        return len(b)
+
+
+async def stream_zip(folder_path, json_data:str = None):
+    """
+    Yield zip chunks as they are produced instead of buffering the whole
+    archive in a BytesIO. The ZipFile runs on a worker thread writing into
+    a bounded queue, so memory stays at a few chunks regardless of archive
+    size and sending overlaps with compression.
+    """
+    queue = asyncio.Queue(maxsize=8)
+    loop = asyncio.get_running_loop()
+
+    def produce():
+        try:
+            with zipfile.ZipFile(_QueueWriter(queue, loop), 'w', zipfile.ZIP_DEFLATED) as zipf:
+                # Добавляем файл с JSON данными
+                if json_data:
+                    # orjson emits UTF-8 bytes directly (same as ensure_ascii=False)
+                    zipf.writestr("manifest.json", orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+
+                # Добавляем файлы из папки
+                for root, dirs, files in os.walk(folder_path):
+                    for file in files:
+                        file_path = os.path.join(root, file)
+                        arcname = os.path.relpath(file_path, folder_path)
+                        # Already-compressed archives gain nothing from deflate
+                        compress = zipfile.ZIP_STORED if file.endswith(('.zip', '.7z')) else zipfile.ZIP_DEFLATED
+                        zipf.write(file_path, arcname, compress_type=compress)
+        finally:
+            asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+
+    producer = asyncio.create_task(asyncio.to_thread(produce))
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            yield chunk
+        await producer
+    finally:
+        # Drain so the producer thread never stays blocked on a full queue
+        # if the client disconnected mid-stream
+        while not producer.done():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            await asyncio.sleep(0.01)
 
 async def getSrcs():
     srcs = []
@@ -432,9 +654,9 @@ async def getSrcs():
 async def getFileByMask(path, mask):
     fullFileName = None
     fileName = None
-    regexp = re.compile(mask)
+    regexp = _compile_cached(mask)
     #Assume that no need to recurcieve search
-    for address, dirs, files in await aiofiles.os.walk(path, topdown=True, onerror=None, followlinks=False):
+    for address, dirs, files in await _walk(path, max_depth=0):
         for file in files:
             if bool(regexp.match(file)):
                 fullFileName = os.path.join(path, file)
@@ -443,12 +665,13 @@ async def getFileByMask(path, mask):
 
     return fullFileName, fileName
 
+@async_ttl_cache(ttl=30, maxsize=512)
 async def getRootFolder(t = None, v = None, src:str = None):
     rootFolder = None
     fw_type = FirmwareType.MESHTASTIC  # default type
 
-    paths = [rf if isinstance(rf, str) else rf.get('path', None) for rf in config['fwDirs']]
-    srcs =  [rf.get('src', None) for rf in config['fwDirs'] if isinstance(rf,dict) and rf.get('src', None)]
+    paths = FW_PATHS
+    srcs = [s['src'] for s in FW_SRCS]
     if not rootFolder and src in srcs:
         for rf in config['fwDirs']:
             if isinstance(rf,dict) and src == rf.get('src', None) and rf.get('path', None):
@@ -462,12 +685,15 @@ async def getRootFolder(t = None, v = None, src:str = None):
         try:
             for rf in paths:
                 if v:
+                    known = (rf, t, v) in _known_dirs
                     path = os.path.join(rf,t,v)
                 elif t:
+                    known = (rf, t) in _known_dirs
                     path = os.path.join(rf,t)
                 else:
+                    known = False
                     path = os.path.join(rf)
-                if(await aiofiles.os.path.isdir(path)):
+                if known or (await aiofiles.os.path.isdir(path)):
                     for s in config['fwDirs']:
                         if isinstance(s,dict) and s.get('path', None) == rf:
                             src = s.get('src', None)
@@ -480,6 +706,43 @@ async def getRootFolder(t = None, v = None, src:str = None):
             rootFolder = None
     return rootFolder, src, fw_type
 
+async def detectChipFamily(rootFolder, t:str):
+    """
+    Detect chip family for a single device by probing only its own folder.
+    Replaces the full getAvailableFirmwares() walk with an O(versions-of-one-device) scan.
+    """
+    def probe():
+        device_path = os.path.join(rootFolder, t)
+        uf2find = False
+        otafind = False
+        try:
+            version_dirs = []
+            jdev = None
+            with os.scandir(device_path) as entries:
+                for entry in entries:
+                    if entry.name == "device.info" and entry.is_file():
+                        jdev = orjson.loads(_read_file(entry.path))
+                    elif entry.is_dir() and not entry.name.startswith('_'):
+                        version_dirs.append(entry.path)
+            if jdev:
+                families = {'nrf52': "NRF52", 'rp2040': "RP2040", 'esp32': "ESP32"}
+                family = families.get(jdev.get('type'))
+                if family:
+                    return family
+            for vd in version_dirs:
+                u, o = classify_version_files(os.listdir(vd))
+                uf2find = uf2find or u
+                otafind = otafind or o
+        except OSError:
+            pass
+        if uf2find and otafind: #nrf devices
+            return "NRF52"
+        if uf2find: #rp2040 devices
+            return "RP2040"
+        return "ESP32"
+    return await asyncio.to_thread(probe)
+
+@async_ttl_cache(ttl=30, maxsize=256)
 async def buildManifest(t:str = None, v:str = None, u:str = "1", src:str = None):
     log.debug("Build manifest: %s, %s for %s",t,v, src)
     manifest = {
@@ -510,7 +773,7 @@ async def buildManifest(t:str = None, v:str = None, u:str = "1", src:str = None)
 
                 # Get flash size from format_analysis
                 analysis_json = format_analysis(table)
-                analysis = json.loads(analysis_json)
+                analysis = orjson.loads(analysis_json)
                 flashsize_from_partitions = analysis.get('flash_size_mb')
 
                 # Find partitions by type/subtype (analog findBestMatch from frontend)
@@ -615,7 +878,7 @@ async def buildManifest(t:str = None, v:str = None, u:str = "1", src:str = None)
     bleotav = 'mt-esp32-ota'
 
     chip_family = "ESP32"
-    if ("s3" in t) or ("-v3" in t) or ("t-deck" in t) or ("wireless-paper" in t) or ("wireless-tracker" in t) or devinfo.get("chip", None) == 'esp32s3':
+    if _S3_VARIANT_RE.search(t) or devinfo.get("chip", None) == 'esp32s3':
         chip_family = "ESP32-S3"
         bleotav = 'mt-esp32s3-ota'
     elif ("c3" in t or devinfo.get("chip", None) == 'esp32c3'):
@@ -625,45 +888,60 @@ async def buildManifest(t:str = None, v:str = None, u:str = "1", src:str = None)
         chip_family = "ESP32-C6"
         bleotav = 'bleota-c3'
     else:  # Need to check nrf52/rp2040 somehow, but this method in most cases no need to invoke for nrf/rp2040
-        data = await getAvailableFirmwares()
-        if t in data.get('uf2devices'):
-            chip_family = "NRF52"
-        elif  t in data.get('espdevices'):
-            chip_family = "ESP32"
-        elif  t in data.get('rp2040devices'):
-            chip_family = "RP2040"
+        # device.info is already loaded into devinfo - no filesystem probe needed
+        families = {'esp32': "ESP32", 'nrf52': "NRF52", 'rp2040': "RP2040"}
+        family = families.get(devinfo.get("type", None))
+        if family:
+            chip_family = family
+        elif rootFolder:
+            chip_family = await detectChipFamily(rootFolder, t)
 
     manifest["builds"][0]['flashsize'] = flashsize
     manifest["builds"][0]["chipFamily"] = chip_family
-    manifest['pathfw'] = "api/firmware?v={0}&t={1}&u={2}&e=false&src={3}".format(v,t,u,src)
+    manifest['pathfw'] = f"api/firmware?v={v}&t={t}&u={u}&e=false&src={src}"
     if chip_family == 'NRF52':
         #manifest['pathfw'] = "api/firmware?v={0}&t={1}&u={2}&e=false".format(v,t,u)
-        manifest['pathota'] = "api/firmware?v={0}&t={1}&u=4&e=false&src={3}".format(v,t,u,src) #u=4 for ota
+        manifest['pathota'] = f"api/firmware?v={v}&t={t}&u=4&e=false&src={src}" #u=4 for ota
     elif chip_family == 'RP2040':
         #manifest['pathfw'] = "api/firmware?v={0}&t={1}&u={2}&e=false".format(v,t,u)
         pass
     elif u =="1":
         offset= update_offset
-        path = "firmware?v={0}&t={1}&u={2}&src={3}".format(v,t,u,src)
+        path = f"firmware?v={v}&t={t}&u={u}&src={src}"
         manifest["builds"][0]["parts"].append({ "path": path, "offset": offset })
 
     else:
         # Build manifest based on firmware type
         if fw_type == FirmwareType.MESHCORE:
             # Meshcore: only firmware part (no OTA/LittleFS)
-            pathfw = "firmware?v={0}&t={1}&u={2}&p={3}&src={4}".format(v,t,u,'fw',src)
+            pathfw = f"firmware?v={v}&t={t}&u={u}&p=fw&src={src}"
             manifest["builds"][0]["parts"].append({ "path": pathfw, "offset": install_fw_offset })
         else:
             # Meshtastic: standard manifest with all parts
-            pathfw = "firmware?v={0}&t={1}&u={2}&p={3}&src={4}".format(v,t,u,'fw',src)
-            pathbleota = "firmware?v={0}&t={1}&u={2}&p={3}&src={4}".format(v,t,u, bleotav,src)
-            pathlittlefs = "firmware?v={0}&t={1}&u={2}&p={3}&src={4}".format(v,t,u,'littlefs',src)
+            pathfw = f"firmware?v={v}&t={t}&u={u}&p=fw&src={src}"
+            pathbleota = f"firmware?v={v}&t={t}&u={u}&p={bleotav}&src={src}"
+            pathlittlefs = f"firmware?v={v}&t={t}&u={u}&p=littlefs&src={src}"
             manifest["builds"][0]["parts"].append({ "path": pathfw, "offset": install_fw_offset })
             manifest["builds"][0]["parts"].append({ "path": pathbleota, "offset": install_bleota_offset })
             manifest["builds"][0]["parts"].append({ "path": pathlittlefs, "offset": install_littlefs_offset })
 
     return manifest
 
+class FirmwareFileResponse(FileResponse):
+    """
+    FileResponse with a larger read chunk for multi-megabyte firmware blobs.
+    Fewer read+send iterations per download means fewer per-chunk buffer
+    allocations and event-loop round-trips than the 64 KiB default.
+
+    Starlette hands the file path straight to the server via the
+    http.response.pathsend ASGI extension (kernel sendfile, no user-space
+    copies) when the server supports it, so binaries must keep going
+    through FileResponse - never through a manual read loop or
+    StreamingResponse.
+    """
+    chunk_size = 256 * 1024
+
+
 # Инициализация базы MIME-types
 mimetypes.init()
 
@@ -681,11 +959,29 @@ def getClientIp(request: Request) -> str:
         return forwarded.split(',')[0].strip()
     return request.client.host if request.client else None
 
-async def getIpInfo(ip: str):
-    """Get IP geolocation info (country, city) with timeout"""
-    if not ip:
-        return None
-
+# Shared session for geolocation lookups - keeps the connection pool
+# and DNS cache warm instead of paying a new handshake per request
+_ipinfo_session = None
+_ipinfo_session_lock = asyncio.Lock()
+
+async def _get_ipinfo_session(timeout):
+    global _ipinfo_session
+    if _ipinfo_session is None or _ipinfo_session.closed:
+        # Lock so concurrent first lookups don't each create a session
+        # and leak the losing connector
+        async with _ipinfo_session_lock:
+            if _ipinfo_session is None or _ipinfo_session.closed:
+                _ipinfo_session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300),
+                    timeout=aiohttp.ClientTimeout(total=timeout))
+    return _ipinfo_session
+
+# IP -> geo data is stable, so repeat clients skip the outbound lookup
+# for an hour; concurrent misses for one IP share a single request.
+# Network errors propagate so the decorator never caches a transient
+# failure - getIpInfo below turns them into None per call
+@async_ttl_cache(ttl=3600, maxsize=4096)
+async def _fetch_ip_info(ip: str):
     ipInfoConfig = config.get('ipInfo', {})
     url = ipInfoConfig.get('url')
     timeout = ipInfoConfig.get('timeout')
@@ -693,21 +989,27 @@ async def getIpInfo(ip: str):
     if not url:
         return None
 
+    session = await _get_ipinfo_session(timeout)
+    async with session.get(f"{url}/{ip}") as response:
+            if response.status == 200:
+                data = await response.json()
+                country = data.get('country_name_official')
+                city = data.get('city')
+                if country or city:
+                    return {
+                        'country': country,
+                        'city': city
+                    }
+    return None
+
+async def getIpInfo(ip: str):
+    """Get IP geolocation info (country, city) with timeout"""
+    if not ip:
+        return None
     try:
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=timeout)) as session:
-            async with session.get(f"{url}/{ip}") as response:
-                if response.status == 200:
-                    data = await response.json()
-                    country = data.get('country_name_official')
-                    city = data.get('city')
-                    if country or city:
-                        return {
-                            'country': country,
-                            'city': city
-                        }
+        return await _fetch_ip_info(ip)
     except Exception as e:
-        log.debug(f"Failed to get IP info for {ip}: {e}")
-
+        log.debug("Failed to get IP info for %s: %s", ip, e)
     return None
 
 async def validateAndSecurePath(basePath: str, userPath: str) -> str:
@@ -746,23 +1048,26 @@ async def logFileDownload(
     path: str | None = None
 ):
     """Centralized logging for file downloads"""
+    # Skip the ipInfo lookup and message formatting entirely when INFO is off
+    if not log.isEnabledFor(logging.INFO):
+        return
     clientIp = getClientIp(request)
     ipInfo = await getIpInfo(clientIp) if clientIp else None
 
+    geo = f", country: {ipInfo.get('country')}, city: {ipInfo.get('city')}" if ipInfo else ""
+    # Lazy %-args: request.url/client/headers are only stringified when
+    # the record is actually emitted
     if file_type == "firmware":
         # Old format for monitoring compatibility
-        logMsg = f"DownloadFile: type: {device}, version: {version}, path: {path}, filename: {filename}, url: {str(request.url)}, client: {str(request.client)}, headers: {str(request.headers)}"
-    else:
+        log.info("DownloadFile: type: %s, version: %s, path: %s, filename: %s, url: %s, client: %s, headers: %s%s",
+                 device, version, path, filename, request.url, request.client, request.headers, geo)
+    elif device:
         # New format for other file types
-        logMsg = f"Download {file_type}:"
-        if device:
-            logMsg += f" device: {device},"
-        logMsg += f" repository: {repository}, file: {filename}, url: {str(request.url)}, client: {str(request.client)}"
-
-    if ipInfo:
-        logMsg += f", country: {ipInfo.get('country')}, city: {ipInfo.get('city')}"
-
-    log.info(logMsg)
+        log.info("Download %s: device: %s, repository: %s, file: %s, url: %s, client: %s%s",
+                 file_type, device, repository, filename, request.url, request.client, geo)
+    else:
+        log.info("Download %s: repository: %s, file: %s, url: %s, client: %s%s",
+                 file_type, repository, filename, request.url, request.client, geo)
 
 
 # Lifespan context manager for startup/shutdown events
@@ -799,6 +1104,9 @@ async def lifespan(app: FastAPI):
         await close_valkey()
     except Exception:
         pass
+    # Shutdown: close the shared ipinfo session
+    if _ipinfo_session is not None and not _ipinfo_session.closed:
+        await _ipinfo_session.close()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -826,11 +1134,13 @@ async def getSources(request: Request):
     clientIp = getClientIp(request)
     ipInfo = await getIpInfo(clientIp) if clientIp else None
 
-    logMsg = f"GetSources: url: {str(request.url)}, client: {str(request.client)}, headers: {str(request.headers)}"
+    # Lazy %-args: the full header list is only stringified when DEBUG is on
     if ipInfo:
-        logMsg += f", country: {ipInfo.get('country')}, city: {ipInfo.get('city')}"
-
-    log.debug(logMsg)
+        log.debug("GetSources: url: %s, client: %s, headers: %s, country: %s, city: %s",
+                  request.url, request.client, request.headers, ipInfo.get('country'), ipInfo.get('city'))
+    else:
+        log.debug("GetSources: url: %s, client: %s, headers: %s",
+                  request.url, request.client, request.headers)
 
     # Record visit event for stats
     stats_config = config.get('stats', {})
@@ -854,7 +1164,7 @@ async def getSources(request: Request):
             log.warning(f"Failed to record visit event: {e}")
 
     sources = await getSrcs()
-    return JSONResponse(content={
+    return ORJSONResponse(content={
         'sources': sources,
         'stats_enabled': stats_config.get('enabled', False),
     })
@@ -862,22 +1172,22 @@ async def getSources(request: Request):
 # availableFirmwares.json
 @app.get("/api/availableFirmwares", status_code=200)
 async def getAvailableFw(request: Request, src:str = None):
-    return JSONResponse(content= await getAvailableFirmwares(src = src))
+    return ORJSONResponse(content= await getAvailableFirmwares(src = src))
 
 # Manifest.json
 @app.get("/api/manifest", status_code=200)
 async def getManifest(request: Request, t:str = None, v:str = None, u:str = "1", src:str = None):
-    return JSONResponse(content= await buildManifest(t, v, u, src))
+    return ORJSONResponse(content= await buildManifest(t, v, u, src))
 
 # Infoblock (HTML)
 @app.get("/api/infoblock", status_code=200)
 async def getInfoblock(request: Request, t:str = None, v:str = None, src:str = None):
-    return JSONResponse(content= await buildInfoblock(t,v, src))
+    return ORJSONResponse(content= await buildInfoblock(t,v, src))
 
 # Versions for device
 @app.get("/api/versions", status_code=200)
 async def getVersions(request: Request, t:str = None, src:str = None):
-    return JSONResponse(content= await buildVersions(t=t, src=src))
+    return ORJSONResponse(content= await buildVersions(t=t, src=src))
 
 @app.get("/api/firmware" )
 async def download_file(request: Request, t:str = None, v:str = None, u:str = "1", p:str = None, e:bool = True, src = None):
@@ -887,7 +1197,7 @@ async def download_file(request: Request, t:str = None, v:str = None, u:str = "1
     rootFolder, src, fw_type = await getRootFolder(t,v,src)
 
     if not rootFolder:
-        return JSONResponse(content={'error': 'No such firmware found'}, status_code=404)
+        return ORJSONResponse(content={'error': 'No such firmware found'}, status_code=404)
 
     # Init to protect from NameError when no branch matches (unified 404 check below)
     path = None
@@ -900,22 +1210,18 @@ async def download_file(request: Request, t:str = None, v:str = None, u:str = "1
         dir_exists = await aiofiles.os.path.isdir(version_dir)
         has_files = False
         if dir_exists:
-            async for _root, _dirs, files in aiofiles.os.walk(version_dir):
+            for _root, _dirs, files in await _walk(version_dir):
                 if files:
                     has_files = True
                     break
         if not dir_exists or not has_files:
-            return JSONResponse(content={'error': 'No such firmware found'}, status_code=404)
-        zip_buffer = await generate_zip(version_dir, await buildManifest(t = t, v = v, u = u, src = src))
-        zip_buffer.seek(0, 2)  # Переходим в конец
-        zip_size = zip_buffer.tell()  # Получаем размер
-        zip_buffer.seek(0)  # Возвращаемся в начало
+            return ORJSONResponse(content={'error': 'No such firmware found'}, status_code=404)
+        # Size is unknown upfront for a streamed archive - chunked transfer instead
         return StreamingResponse(
-            zip_buffer,
+            stream_zip(version_dir, await buildManifest(t = t, v = v, u = u, src = src)),
             media_type="application/zip",
                 headers={
-                    "Content-Disposition": f"attachment; filename={t}-{v}.zip",
-                    "Content-Length": str(zip_size)
+                    "Content-Disposition": f"attachment; filename={t}-{v}.zip"
                 }
         )
 
@@ -955,8 +1261,8 @@ async def download_file(request: Request, t:str = None, v:str = None, u:str = "1
                 path, filename = await getFileByMask(os.path.join(rootFolder,t,v),r".*littlefs.*\.bin")
             if 'ota' in p:
                 logInd = False # Do not log additional files downloads
-                if not re.match(r'^[a-zA-Z0-9_.-]+$', p):
-                    return JSONResponse(content={'error': 'Invalid ota parameter'}, status_code=400)
+                if not _SAFE_NAME_RE.match(p):
+                    return ORJSONResponse(content={'error': 'Invalid ota parameter'}, status_code=400)
                 path = f"bin/{p}.bin"
                 filename = f"{p}.bin"
 
@@ -994,8 +1300,8 @@ async def download_file(request: Request, t:str = None, v:str = None, u:str = "1
             log.warning(f"Failed to record download event: {ex}")
     # Unified check: missing branch match (path is None) OR file does not exist on disk -> 404
     if not path or not await aiofiles.os.path.isfile(path):
-        return JSONResponse(content={'error': 'Firmware file not found'}, status_code=404)
-    return FileResponse(path=path, filename=filename, media_type=await getMimeType(path))
+        return ORJSONResponse(content={'error': 'Firmware file not found'}, status_code=404)
+    return FirmwareFileResponse(path=path, filename=filename, media_type=await getMimeType(path))
 
 @app.get("/api/files")
 async def getArchiveFiles(
@@ -1013,14 +1319,14 @@ async def getArchiveFiles(
     """
     # Validate type parameter
     if type != "archives":
-        return JSONResponse(
+        return ORJSONResponse(
             content={'error': 'Invalid type parameter, must be "archives"'},
             status_code=400
         )
 
     # Validate required parameters (no 't' parameter needed!)
     if not repo:
-        return JSONResponse(
+        return ORJSONResponse(
             content={'error': 'Missing required parameter: repo'},
             status_code=400
         )
@@ -1028,7 +1334,7 @@ async def getArchiveFiles(
     # Get repository path WITHOUT device type
     rootFolder, src, fw_type = await getRootFolder(None, None, repo)
     if not rootFolder:
-        return JSONResponse(
+        return ORJSONResponse(
             content={'error': 'Repository not found'},
             status_code=404
         )
@@ -1038,7 +1344,7 @@ async def getArchiveFiles(
 
     # Check if archive directory exists (return empty list if not)
     if not await aiofiles.os.path.isdir(archive_path):
-        return JSONResponse(
+        return ORJSONResponse(
             content={'files': []},  # Empty list = no archives available
             status_code=200
         )
@@ -1046,8 +1352,8 @@ async def getArchiveFiles(
     if file:
         # Download specific file
         # Validate filename to prevent path traversal
-        if not re.match(r'^[a-zA-Z0-9._-]+$', file):
-            return JSONResponse(
+        if not _SAFE_NAME_RE.match(file):
+            return ORJSONResponse(
                 content={'error': 'Invalid filename'},
                 status_code=400
             )
@@ -1056,14 +1362,14 @@ async def getArchiveFiles(
         try:
             file_path = await validateAndSecurePath(archive_path, file)
         except ValueError:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={'error': 'Path traversal detected'},
                 status_code=400
             )
 
         # Check if file exists
         if not await aiofiles.os.path.isfile(file_path):
-            return JSONResponse(
+            return ORJSONResponse(
                 content={'error': 'File not found'},
                 status_code=404
             )
@@ -1078,7 +1384,7 @@ async def getArchiveFiles(
         )
 
         # Return file
-        return FileResponse(
+        return FirmwareFileResponse(
             path=file_path,
             filename=file,
             media_type=await getMimeType(file_path)
@@ -1086,21 +1392,26 @@ async def getArchiveFiles(
     else:
         # List available files
         files = await listZipFilesInDirectory(archive_path)
-        return JSONResponse(
+        return ORJSONResponse(
             content={'files': files},
             status_code=200
         )
 
 
 def unirun():
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info", root_path="/")
+    # Import string is required for multi-worker mode; uvloop + httptools
+    # replace the default selector loop and the pure-Python h11 parser
+    uvicorn.run(
+        "service:app",
+        host="0.0.0.0",
+        port=8000,
+        log_level="info",
+        root_path="/",
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
 
 
 if __name__ == "__main__":
-
-
-    t2 = Thread(target=unirun)
-    t2.daemon = True
-    t2.start()
-
-    t2.join()
+    unirun()
@@ -0,0 +1,60 @@
+"""
+Async caching helpers.
+
+Provides a bounded TTL cache decorator for coroutine results without
+pulling in an external cache dependency. Shared between service.py
+endpoints and other async helpers.
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+
+
+def async_ttl_cache(ttl: float = 30.0, maxsize: int = 256):
+    """
+    TTL + LRU cache for async functions with hashable arguments.
+
+    Concurrent callers with the same key await one in-flight task, so a
+    burst of identical requests triggers a single execution (thundering
+    herd collapse). Entries expire after `ttl` seconds; once `maxsize`
+    is reached the least recently used entry is evicted. Failed calls
+    are not cached.
+
+    The wrapped function exposes `cache_clear()` for explicit invalidation.
+    """
+    def decorator(fn):
+        cache = OrderedDict()  # key -> (expires_at, task)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry:
+                expires_at, task = entry
+                valid = expires_at > now
+                if valid and task.done() and (task.cancelled() or task.exception()):
+                    valid = False
+                if valid:
+                    cache.move_to_end(key)
+                    return await asyncio.shield(task)
+                del cache[key]
+
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            cache[key] = (now + ttl, task)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+            try:
+                return await asyncio.shield(task)
+            except Exception:
+                cache.pop(key, None)
+                raise
+
+        def cache_clear():
+            cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
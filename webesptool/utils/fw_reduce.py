@@ -0,0 +1,67 @@
+"""
+Pure reducers for the firmware tree walk.
+
+The classification logic from service.getAvailableFirmwares lives here,
+free of any I/O and fully type-annotated (PEP 484), so the module can be
+compiled with mypyc (`mypyc fw_reduce.py`) without touching the async
+shell in service.py. The plain-Python module works as-is if no compiled
+extension is present.
+"""
+
+from typing import Dict, Optional, Set, Tuple
+
+
+def classify_version_files(file_names: list) -> Tuple[bool, bool]:
+    """Return (uf2_found, ota_found) for one version directory listing."""
+    uf2_found = False
+    ota_found = False
+    for name in file_names:
+        if ".uf2" in name:
+            uf2_found = True
+        if ".zip" in name:
+            ota_found = True
+    return uf2_found, ota_found
+
+
+def classify_device_by_files(
+    device: str,
+    uf2_found: bool,
+    ota_found: bool,
+    espdevices: Set[str],
+    uf2devices: Set[str],
+    rp2040devices: Set[str],
+) -> None:
+    """Sort a device into the type sets based on files found in a version dir."""
+    if not uf2_found:
+        espdevices.add(device)
+    if uf2_found and ota_found:  # nrf devices
+        uf2devices.add(device)
+    if uf2_found and not ota_found:  # rp2040 devices
+        rp2040devices.add(device)
+
+
+def classify_device_by_info(
+    device: str,
+    jdev: Dict[str, object],
+    espdevices: Set[str],
+    uf2devices: Set[str],
+    rp2040devices: Set[str],
+    device_names: Dict[str, str],
+) -> bool:
+    """
+    Sort a device into the type sets based on its parsed device.info.
+
+    Returns True if the info block carried a usable name.
+    """
+    name = jdev.get('name')
+    if not name:
+        return False
+    dev_type: Optional[object] = jdev.get('type')
+    if dev_type == 'esp32':
+        espdevices.add(device)
+    if dev_type == 'nrf52':
+        uf2devices.add(device)
+    if dev_type == 'rp2040':
+        rp2040devices.add(device)
+    device_names[device] = str(name)
+    return True
@@ -1,10 +1,12 @@
+import atexit
 import logging, logging.handlers
+import queue
 import sys
 
 def getLogger():
 
     rfh = logging.handlers.RotatingFileHandler(
-        filename='log/service.log', 
+        filename='log/service.log',
         mode='a',
         maxBytes=50*1024*1024,
         backupCount=2,
@@ -15,12 +17,20 @@ def getLogger():
         sys.stdout
     )
 
-    logging.basicConfig( 
+    # Handlers run on a background QueueListener thread, so log calls in
+    # request coroutines only enqueue the record and never block on disk I/O
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, rfh, sout, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    logging.basicConfig(
         format="[%(asctime)s] %(levelname)-8s [%(name)s.%(funcName)-12s:%(lineno)d] %(message)s",
         datefmt="%d-%m-%Y %H:%M:%S",
         handlers=[
-                rfh,
-                sout
+                logging.handlers.QueueHandler(log_queue)
                 ]
         )
 
@@ -30,4 +40,4 @@ def getLogger():
     logging._nameToLevel['DEBUG2'] = logging.DEBUG2
     log.setLevel('DEBUG2')
 
-    return log
\ No newline at end of file
+    return log
@@ -14,7 +14,7 @@ Example usage:
 
 from .formatters import format_analysis, format_csv, format_json, format_text
 from .models import PartitionEntry, PartitionTable
-from .parser import ParseError, parse_partitions_file
+from .parser import ParseError, parse_partitions_bytes, parse_partitions_file
 from .utils import find_partition_by_type
 from .validator import ValidationError, validate_partition_table
 
@@ -24,6 +24,7 @@ __all__ = [
     "PartitionTable",
     # Parser
     "parse_partitions_file",
+    "parse_partitions_bytes",
     "ParseError",
     # Validator
     "validate_partition_table",
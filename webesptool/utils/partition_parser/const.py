@@ -2,6 +2,8 @@
 Constants for ESP-IDF Partition Table format.
 """
 
+import functools
+
 # Magic numbers (after little-endian unpacking)
 PARTITION_MAGIC = 0x50AA  # Actual value after unpacking from bytes 0xAA, 0x50
 PARTITION_END_MARKER = 0xEBEB  # End marker after unpacking from bytes 0xEB, 0xEB
@@ -86,6 +88,9 @@ PARTITION_ALIGNMENT = 0x1000  # 4KB
 PARTITION_FLAG_ENCRYPTED = 0x01
 
 
+# The (type, subtype) space is bounded by 2x256 values, so an unbounded
+# cache is safe; hits skip the fallback hex-string formatting entirely
+@functools.lru_cache(maxsize=None)
 def get_subtype_name(partition_type: int, subtype: int) -> str:
     """
     Get human-readable subtype name.
@@ -104,6 +109,7 @@ def get_subtype_name(partition_type: int, subtype: int) -> str:
     return f"0x{subtype:02x}"
 
 
+@functools.lru_cache(maxsize=None)
 def get_type_name(partition_type: int) -> str:
     """
     Get human-readable type name.
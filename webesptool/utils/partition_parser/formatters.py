@@ -7,9 +7,23 @@ import json
 from io import StringIO
 from pathlib import Path
 
+# orjson serializes several times faster than stdlib json; the module
+# stays usable without it (standalone CLI installs)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .models import PartitionTable
 
 
+def _dumps(data: dict, indent: int) -> str:
+    # orjson only supports 2-space indentation; other values use stdlib
+    if orjson is not None and indent == 2:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=indent)
+
+
 def format_json(
     table: PartitionTable, human_readable: bool = True, indent: int = 2
 ) -> str:
@@ -25,7 +39,7 @@ def format_json(
         JSON formatted string
     """
     data = table.to_dict(human_readable=human_readable)
-    return json.dumps(data, indent=indent)
+    return _dumps(data, indent)
 
 
 def format_csv(table: PartitionTable) -> str:
@@ -44,18 +58,18 @@ def format_csv(table: PartitionTable) -> str:
     # Write header
     writer.writerow(["Name", "Type", "SubType", "Offset", "Size", "Flags"])
 
-    # Write entries
-    for entry in table.entries:
-        writer.writerow(
-            [
-                entry.name,
-                entry.type_name,
-                entry.subtype_name,
-                f"0x{entry.offset:x}",
-                f"0x{entry.size:x}",
-                f"0x{entry.flags:x}",
-            ]
+    # Write all entries in one batched call
+    writer.writerows(
+        (
+            entry.name,
+            entry.type_name,
+            entry.subtype_name,
+            entry.offset_hex,
+            entry.size_hex,
+            f"0x{entry.flags:x}",
         )
+        for entry in table.entries
+    )
 
     return output.getvalue()
 
@@ -91,6 +105,17 @@ def write_csv(table: PartitionTable, output_path: str | Path) -> None:
     path.write_text(format_csv(table))
 
 
+# One format call per partition instead of seven f-string appends
+_TEXT_ENTRY_TPL = (
+    "\nPartition: {name}\n"
+    "  Type:      {type_name}\n"
+    "  SubType:   {subtype_name}\n"
+    "  Offset:    0x{offset:x} ({offset_kb:.2f} KB)\n"
+    "  Size:      0x{size:x} ({size_mb:.2f} MB)\n"
+    "  Flags:     0x{flags:02x}"
+)
+
+
 def format_text(table: PartitionTable, verbose: bool = False) -> str:
     """
     Format partition table as human-readable text.
@@ -102,24 +127,26 @@ def format_text(table: PartitionTable, verbose: bool = False) -> str:
     Returns:
         Text formatted string
     """
-    lines = []
-
-    lines.append(f"Partition Table ({len(table.entries)} entries)")
-    lines.append("=" * 80)
+    chunks = [f"Partition Table ({len(table.entries)} entries)", "=" * 80]
 
     for entry in table.entries:
-        lines.append(f"\nPartition: {entry.name}")
-        lines.append(f"  Type:      {entry.type_name}")
-        lines.append(f"  SubType:   {entry.subtype_name}")
-        lines.append(f"  Offset:    0x{entry.offset:x} ({entry.offset_kb:.2f} KB)")
-        lines.append(f"  Size:      0x{entry.size:x} ({entry.size_mb:.2f} MB)")
-        lines.append(f"  Flags:     0x{entry.flags:02x}")
+        chunks.append(
+            _TEXT_ENTRY_TPL.format(
+                name=entry.name,
+                type_name=entry.type_name,
+                subtype_name=entry.subtype_name,
+                offset=entry.offset,
+                offset_kb=entry.offset_kb,
+                size=entry.size,
+                size_mb=entry.size_mb,
+                flags=entry.flags,
+            )
+        )
 
-        if verbose:
-            if entry.encrypted:
-                lines.append(f"  Encrypted: Yes")
+        if verbose and entry.encrypted:
+            chunks.append("  Encrypted: Yes")
 
-    return "\n".join(lines)
+    return "\n".join(chunks)
 
 
 def format_analysis(table: PartitionTable, indent: int = 2) -> str:
@@ -136,23 +163,19 @@ def format_analysis(table: PartitionTable, indent: int = 2) -> str:
     Returns:
         JSON formatted string with analysis data
     """
-    # Find partition with maximum (offset + size) instead of using last entry
+    # Find maximum (offset + size) instead of using last entry
     if table.entries:
-        last_entry = max(table.entries, key=lambda e: e.offset + e.size)
-        flash_size_bytes = last_entry.offset + last_entry.size
+        flash_size_bytes = max(e.offset + e.size for e in table.entries)
     else:
         flash_size_bytes = 0
 
-    flash_size_mb = flash_size_bytes / (1024 * 1024)
-
-    # Round to nearest power of 2 (2, 4, 8, 16 MB)
-    # Round UP to ensure flash size is >= last partition
-    for power in [2, 4, 8, 16]:
-        if flash_size_mb <= power:
-            flash_size_str = f"{power}MB"
-            break
+    # Round UP to the next power of 2 (2, 4, 8, 16 MB) so flash size is
+    # >= last partition; bit_length gives the power directly
+    if flash_size_bytes <= 16 * 1024 * 1024:
+        flash_size_str = f"{1 << max(1, (flash_size_bytes - 1).bit_length() - 20)}MB"
     else:
         # Fallback for larger sizes - round up to nearest MB
+        flash_size_mb = flash_size_bytes / (1024 * 1024)
         flash_size_str = f"{int(flash_size_mb) + (1 if flash_size_mb % 1 else 0)}MB"
 
     # Build partitions dict: {name: offset_hex}
@@ -166,4 +189,4 @@ def format_analysis(table: PartitionTable, indent: int = 2) -> str:
         "partitions": partitions_dict,
     }
 
-    return json.dumps(analysis, indent=indent)
+    return _dumps(analysis, indent)
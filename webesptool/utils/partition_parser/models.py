@@ -8,7 +8,9 @@ from typing import Optional
 from .const import get_type_name, get_subtype_name
 
 
-@dataclass
+# slots drops the per-instance __dict__ and frozen makes entries safely
+# shareable between cached tables
+@dataclass(slots=True, frozen=True)
 class PartitionEntry:
     """
     Represents a single partition entry in ESP-IDF partition table.
@@ -28,26 +30,19 @@ class PartitionEntry:
     offset: int
     size: int
     flags: int
-
-    @property
-    def type_name(self) -> str:
-        """Get human-readable partition type name."""
-        return get_type_name(self.type_val)
-
-    @property
-    def subtype_name(self) -> str:
-        """Get human-readable partition subtype name."""
-        return get_subtype_name(self.type_val, self.subtype)
-
-    @property
-    def offset_hex(self) -> str:
-        """Get offset as hex string (0xXXXXXX)."""
-        return f"0x{self.offset:x}"
-
-    @property
-    def size_hex(self) -> str:
-        """Get size as hex string (0xXXXXXX)."""
-        return f"0x{self.size:x}"
+    # Derived once at construction instead of per property access, since
+    # every formatter pass reads them repeatedly
+    type_name: str = field(init=False)
+    subtype_name: str = field(init=False)
+    offset_hex: str = field(init=False)
+    size_hex: str = field(init=False)
+
+    def __post_init__(self):
+        # object.__setattr__ bypasses the frozen guard during init
+        object.__setattr__(self, "type_name", get_type_name(self.type_val))
+        object.__setattr__(self, "subtype_name", get_subtype_name(self.type_val, self.subtype))
+        object.__setattr__(self, "offset_hex", f"0x{self.offset:x}")
+        object.__setattr__(self, "size_hex", f"0x{self.size:x}")
 
     @property
     def offset_kb(self) -> float:
@@ -102,7 +97,8 @@ class PartitionEntry:
         return result
 
 
-@dataclass
+# Not frozen: add_entry mutates the table by design
+@dataclass(slots=True)
 class PartitionTable:
     """
     Represents ESP-IDF partition table.
@@ -114,10 +110,15 @@ class PartitionTable:
 
     md5: Optional[bytes]
     entries: list[PartitionEntry] = field(default_factory=list)
+    # Lazy indexes, built on first lookup and dropped by add_entry
+    _by_name: Optional[dict] = field(default=None, repr=False, compare=False)
+    _by_type_sub: Optional[dict] = field(default=None, repr=False, compare=False)
 
     def add_entry(self, entry: PartitionEntry) -> None:
         """Add a partition entry to the table."""
         self.entries.append(entry)
+        self._by_name = None
+        self._by_type_sub = None
 
     def get_by_name(self, name: str) -> Optional[PartitionEntry]:
         """
@@ -129,10 +130,29 @@ class PartitionTable:
         Returns:
             PartitionEntry if found, None otherwise
         """
-        for entry in self.entries:
-            if entry.name == name:
-                return entry
-        return None
+        if self._by_name is None:
+            # reversed() so the first entry wins on duplicate names,
+            # matching the old linear scan
+            self._by_name = {entry.name: entry for entry in reversed(self.entries)}
+        return self._by_name.get(name)
+
+    def get_by_type_subtype(self, type_val: int, subtype: int) -> list[PartitionEntry]:
+        """
+        Find all partition entries with the given type and subtype.
+
+        Args:
+            type_val: Partition type (app=0x00, data=0x01)
+            subtype: Partition subtype value
+
+        Returns:
+            List of matching entries (empty if none)
+        """
+        if self._by_type_sub is None:
+            index = {}
+            for entry in self.entries:
+                index.setdefault((entry.type_val, entry.subtype), []).append(entry)
+            self._by_type_sub = index
+        return self._by_type_sub.get((type_val, subtype), [])
 
     def to_dict(self, human_readable: bool = False) -> dict:
         """
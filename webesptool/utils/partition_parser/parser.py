@@ -2,12 +2,12 @@
 Parser for ESP-IDF Partition Table binary format.
 """
 
+import asyncio
+import functools
 import struct
 from pathlib import Path
 from typing import BinaryIO
 
-import aiofiles
-
 from .const import (
     PARTITION_ALIGNMENT,
     PARTITION_END_MARKER,
@@ -23,73 +23,51 @@ class ParseError(Exception):
     pass
 
 
-async def parse_partitions_file(file_path: str | Path | BinaryIO) -> PartitionTable:
+# Entry layout: H (magic, 2 bytes) + B (type, 1 byte) + B (subtype, 1 byte) +
+#               I (offset, 4 bytes) + I (size, 4 bytes) + 16s (name, 16 bytes) +
+#               I (flags, 4 bytes)
+# Precompiled once so the format string is not re-parsed per entry
+_ENTRY_STRUCT = struct.Struct("<HBBII16sI")
+
+
+def parse_partitions_bytes(data: bytes) -> PartitionTable:
     """
-    Parse ESP-IDF partition table from binary file (ASYNC VERSION).
+    Parse ESP-IDF partition table from in-memory bytes (pure, no I/O).
 
     Args:
-        file_path: Path to partitions.bin file or file-like object (BinaryIO)
+        data: Raw partition table content
 
     Returns:
         PartitionTable object with parsed entries
 
     Raises:
-        FileNotFoundError: If file doesn't exist
-        ParseError: If file format is invalid
+        ParseError: If the data format is invalid
     """
-    # Handle file-like object (for backward compatibility)
-    if hasattr(file_path, 'read'):
-        # File-like object - read data from it
-        file_path.seek(0)  # Ensure we're at the beginning
-        data = file_path.read()
-        if not isinstance(data, bytes):
-            data = data.encode() if hasattr(data, 'encode') else bytes(data)
-    else:
-        # Path string or Path object - use async file I/O
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Partition table file not found: {file_path}")
-
-        # Async file reading using aiofiles
-        async with aiofiles.open(path, 'rb') as f:
-            data = await f.read()
-
     # Check minimum file size (at least one entry)
     if len(data) < PARTITION_ENTRY_SIZE:
         raise ParseError(
             f"File too small: {len(data)} bytes, expected at least {PARTITION_ENTRY_SIZE} bytes"
         )
 
-    # Parse partition entries
+    # Parse partition entries in a single C-level pass over whole entries;
+    # a trailing partial entry is treated as unexpected end of file below
     table = PartitionTable(md5=None)
     offset = 0
-
-    while True:
-        # Check if we have enough data for another entry
-        if offset + PARTITION_ENTRY_SIZE > len(data):
-            raise ParseError(f"Unexpected end of file at offset {offset}")
-
-        entry_data = data[offset : offset + PARTITION_ENTRY_SIZE]
-
-        # Unpack entry
-        # Format: H (magic, 2 bytes) + B (type, 1 byte) + B (subtype, 1 byte) +
-        #         I (offset, 4 bytes) + I (size, 4 bytes) + 16s (name, 16 bytes) +
-        #         I (flags, 4 bytes)
-        try:
-            (
-                magic,
-                type_val,
-                subtype,
-                offset_val,
-                size_val,
-                name_bytes,
-                flags,
-            ) = struct.unpack("<HBBII16sI", entry_data)
-        except struct.error as e:
-            raise ParseError(f"Failed to unpack entry at offset {offset}: {e}")
-
+    usable = (len(data) // PARTITION_ENTRY_SIZE) * PARTITION_ENTRY_SIZE
+    end_found = False
+
+    for (
+        magic,
+        type_val,
+        subtype,
+        offset_val,
+        size_val,
+        name_bytes,
+        flags,
+    ) in _ENTRY_STRUCT.iter_unpack(memoryview(data)[:usable]):
         # Check for end marker
         if magic == PARTITION_END_MARKER:
+            end_found = True
             break
 
         # Validate magic number
@@ -99,8 +77,12 @@ async def parse_partitions_file(file_path: str | Path | BinaryIO) -> PartitionTa
                 f"expected 0x{PARTITION_MAGIC:04x}"
             )
 
-        # Extract null-terminated name
-        name = name_bytes.rstrip(b"\x00").decode("utf-8", errors="replace")
+        # Extract null-terminated name: stop at the first NUL (C semantics)
+        # instead of scanning the whole 16-byte field from the right
+        nul = name_bytes.find(b"\x00")
+        name = (name_bytes[:nul] if nul != -1 else name_bytes).decode(
+            "utf-8", errors="replace"
+        )
 
         # Create partition entry
         entry = PartitionEntry(
@@ -115,9 +97,56 @@ async def parse_partitions_file(file_path: str | Path | BinaryIO) -> PartitionTa
         table.add_entry(entry)
         offset += PARTITION_ENTRY_SIZE
 
+    if not end_found:
+        raise ParseError(f"Unexpected end of file at offset {offset}")
+
     return table
 
 
+# Parsed tables keyed by (path, mtime_ns, size); an identical binary is
+# parsed once. Callers share the cached table and must not mutate it.
+@functools.lru_cache(maxsize=64)
+def _parse_cached(path_str: str, mtime_ns: int, size: int) -> PartitionTable:
+    return parse_partitions_bytes(Path(path_str).read_bytes())
+
+
+async def parse_partitions_file(file_path: str | Path | BinaryIO) -> PartitionTable:
+    """
+    Parse ESP-IDF partition table from binary file (ASYNC VERSION).
+
+    Results for on-disk files are cached by path, mtime and size, so
+    repeated requests for the same binary skip the read and parse.
+
+    Args:
+        file_path: Path to partitions.bin file or file-like object (BinaryIO)
+
+    Returns:
+        PartitionTable object with parsed entries
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        ParseError: If file format is invalid
+    """
+    # Handle file-like object (for backward compatibility)
+    if hasattr(file_path, 'read'):
+        # File-like object - read data from it
+        file_path.seek(0)  # Ensure we're at the beginning
+        data = file_path.read()
+        if not isinstance(data, bytes):
+            data = data.encode() if hasattr(data, 'encode') else bytes(data)
+        return parse_partitions_bytes(data)
+
+    path = Path(file_path)
+    try:
+        # Partition tables are tiny (a few KB), so one executor hop with a
+        # plain stat+read beats aiofiles' per-operation thread dispatch
+        st = await asyncio.to_thread(path.stat)
+    except OSError:
+        raise FileNotFoundError(f"Partition table file not found: {file_path}")
+
+    return await asyncio.to_thread(_parse_cached, str(path), st.st_mtime_ns, st.st_size)
+
+
 async def parse_partitions_with_validation(
     file_path: str | Path, validate_overlaps: bool = True
 ) -> PartitionTable:
@@ -2,6 +2,7 @@
 Utility functions for ESP-IDF Partition Table.
 """
 
+from operator import attrgetter
 from typing import Optional
 
 from .models import PartitionTable
@@ -37,19 +38,11 @@ def find_partition_by_type(
     if not table or not table.entries:
         return None
 
-    # Filter entries by type_val and subtype
-    matches = [
-        entry for entry in table.entries
-        if entry.type_val == type_val and entry.subtype in subtypes
-    ]
+    # Walk subtypes in priority order against the table's (type, subtype)
+    # index: the first non-empty bucket wins, minimal offset within it
+    for subtype in subtypes:
+        bucket = table.get_by_type_subtype(type_val, subtype)
+        if bucket:
+            return min(bucket, key=attrgetter("offset")).offset
 
-    if not matches:
-        return None
-
-    # Sort by subtype priority (index in subtypes list), then by minimal offset
-    prioritized = sorted(
-        matches,
-        key=lambda e: (subtypes.index(e.subtype), e.offset)
-    )
-
-    return prioritized[0].offset
+    return None
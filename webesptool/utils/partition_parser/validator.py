@@ -2,6 +2,8 @@
 Validation for ESP-IDF Partition Table.
 """
 
+from operator import attrgetter
+
 from .const import PARTITION_ALIGNMENT
 from .models import PartitionTable
 from .parser import ParseError
@@ -58,13 +60,13 @@ def _validate_entry(entry, index: int) -> None:
             f"Entry {index} ({entry.name}): name too long ({len(entry.name)} > 16)"
         )
 
-    # Check alignment
-    if entry.offset % PARTITION_ALIGNMENT != 0:
+    # Check alignment (bitmask works because the alignment is a power of two)
+    if entry.offset & (PARTITION_ALIGNMENT - 1):
         raise ValidationError(
             f"Entry {index} ({entry.name}): offset {entry.offset} is not aligned to {PARTITION_ALIGNMENT} bytes"
         )
 
-    if entry.size % PARTITION_ALIGNMENT != 0 and entry.size != 0xFFFFFFFF:
+    if entry.size & (PARTITION_ALIGNMENT - 1) and entry.size != 0xFFFFFFFF:
         raise ValidationError(
             f"Entry {index} ({entry.name}): size {entry.size} is not aligned to {PARTITION_ALIGNMENT} bytes"
         )
@@ -80,9 +82,9 @@ def _check_overlaps(table: PartitionTable) -> None:
     Raises:
         ValidationError: If overlaps are found
     """
-    # Sort entries by offset
+    # Sort entries by offset (attrgetter keeps key extraction at C level)
     sorted_entries = sorted(
-        [e for e in table.entries if e.offset > 0], key=lambda e: e.offset
+        [e for e in table.entries if e.offset > 0], key=attrgetter("offset")
     )
 
     for i in range(len(sorted_entries) - 1):
@@ -102,41 +104,3 @@ def _check_overlaps(table: PartitionTable) -> None:
                 f"size={current.size:#x}, end={current_end:#x}) overlaps with "
                 f"'{next_entry.name}' (offset={next_entry.offset:#x})"
             )
-
-
-def check_alignment(value: int, alignment: int = PARTITION_ALIGNMENT) -> bool:
-    """
-    Check if a value is aligned to the specified boundary.
-
-    Args:
-        value: Value to check
-        alignment: Alignment boundary (default 4KB)
-
-    Returns:
-        True if aligned, False otherwise
-    """
-    return value % alignment == 0
-
-
-def format_size(size_bytes: int) -> str:
-    """
-    Format size in human-readable format.
-
-    Args:
-        size_bytes: Size in bytes
-
-    Returns:
-        Formatted size string (e.g., "1.5 MB", "512 KB")
-    """
-    if size_bytes == 0xFFFFFFFF:
-        return "rest of flash"
-
-    mb = size_bytes / (1024 * 1024)
-    kb = size_bytes / 1024
-
-    if mb >= 1:
-        return f"{mb:.2f} MB"
-    elif kb >= 1:
-        return f"{kb:.2f} KB"
-    else:
-        return f"{size_bytes} bytes"
@@ -5,23 +5,33 @@ Provides CustomLooseVersion class for sorting and comparing firmware versions.
 Shared between service.py and other modules like archive_manager.
 """
 
+import functools
 import re
-from looseversion import LooseVersion
 
+_SPLIT_RE = re.compile(r'[\. ]')
 
-class CustomLooseVersion(LooseVersion):
+
+class CustomLooseVersion:
     """
-    Extended LooseVersion that handles meshtastic-specific version formats.
+    Loose version comparator that handles meshtastic-specific formats.
 
     Supports version strings like:
     - v2.4.3.efc27f2
     - v1.11.0.6d32193.companion.ble
     - v1.5.0.daily
+
+    Standalone replacement for the old looseversion.LooseVersion subclass.
+    Comparisons never mutate the parsed components, so the same object can
+    be reused (and cached) across sorts with deterministic results.
     """
 
+    def __init__(self, vstring=None):
+        if vstring:
+            self.parse(vstring)
+
     def parse(self, vstring):
         self.vstring = vstring
-        components = re.split(r'[\. ]', vstring)
+        components = _SPLIT_RE.split(vstring)
         for i, obj in enumerate(components):
             try:
                 components[i] = int(obj)
@@ -30,35 +40,79 @@ class CustomLooseVersion(LooseVersion):
 
         self.version = components
 
+    def __str__(self):
+        return self.vstring
+
+    def __repr__(self):
+        return f"CustomLooseVersion ('{self}')"
+
     def _cmp(self, other):
         if isinstance(other, str):
             other = CustomLooseVersion(other)
         elif not isinstance(other, CustomLooseVersion):
             return NotImplemented
 
-        # If elements have different types - compare as strings
-        min_len = min(len(self.version), len(other.version))
-        for i in range(min_len):
-            try:
-                if i >= len(other.version):
-                    return 1
-                if i >= len(self.version):
-                    return -1
-
-                if type(self.version[i]) != type(other.version[i]):
-                    self.version[i] = str(self.version[i])
-                    other.version[i] = str(other.version[i])
-            except Exception:
-                pass
+        # Compare on local copies: components with mismatched types are
+        # stringified pairwise without touching self.version/other.version
+        a = list(self.version)
+        b = list(other.version)
+        for i in range(min(len(a), len(b))):
+            if type(a[i]) is not type(b[i]):
+                a[i] = str(a[i])
+                b[i] = str(b[i])
 
-        if "daily" in self.vstring and "daily" not in other.vstring and self.version[:len(self.version)-1] == other.version[:len(other.version)-1]:
+        # A daily build outranks the matching non-daily release
+        if "daily" in self.vstring and "daily" not in other.vstring and a[:len(a)-1] == b[:len(b)-1]:
             return 1
-        if "daily" not in self.vstring and "daily" in other.vstring and self.version[:len(self.version)-1] == other.version[:len(other.version)-1]:
+        if "daily" not in self.vstring and "daily" in other.vstring and a[:len(a)-1] == b[:len(b)-1]:
             return -1
 
-        if self.version == other.version:
+        if a == b:
             return 0
-        if self.version < other.version:
+        if a < b:
             return -1
-        if self.version > other.version:
-            return 1
+        return 1
+
+    def __eq__(self, other):
+        c = self._cmp(other)
+        if c is NotImplemented:
+            return c
+        return c == 0
+
+    def __lt__(self, other):
+        c = self._cmp(other)
+        if c is NotImplemented:
+            return c
+        return c < 0
+
+    def __le__(self, other):
+        c = self._cmp(other)
+        if c is NotImplemented:
+            return c
+        return c <= 0
+
+    def __gt__(self, other):
+        c = self._cmp(other)
+        if c is NotImplemented:
+            return c
+        return c > 0
+
+    def __ge__(self, other):
+        c = self._cmp(other)
+        if c is NotImplemented:
+            return c
+        return c >= 0
+
+
+@functools.lru_cache(maxsize=4096)
+def version_key(vstring):
+    """
+    Memoized CustomLooseVersion for use as a sort key.
+
+    Version strings repeat across requests, so caching the parsed object
+    skips the re.split/int() parsing on every sort. A plain tuple key would
+    be faster still, but CustomLooseVersion._cmp coerces mismatched
+    component types and special-cases 'daily' builds against its comparison
+    partner, which a static per-element key cannot reproduce.
+    """
+    return CustomLooseVersion(vstring)